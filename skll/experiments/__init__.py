@@ -597,7 +597,9 @@ def _classify_featureset(args: Dict[str, Any]) -> List[Dict[str, Any]]:
         # write out the cv folds if required
         if task == "cross_validate" and save_cv_folds and skll_fold_ids is not None:
             skll_fold_ids_file = f"{experiment_name}_skll_fold_ids.csv"
-            with open(Path(results_path) / skll_fold_ids_file, "w") as output_file:
+            with open(
+                Path(results_path) / skll_fold_ids_file, "w", buffering=1 << 20
+            ) as output_file:
                 _write_skll_folds(skll_fold_ids, output_file)
 
     finally:
@@ -12,25 +12,140 @@ from __future__ import annotations
 
 import csv
 import json
-import math
 import sys
 from collections import defaultdict
+from functools import lru_cache
+from multiprocessing import cpu_count
 from pathlib import Path
-from typing import IO, Any, Dict, List, Tuple
+from typing import IO, Any, Dict, FrozenSet, List, Tuple
 
+import joblib
 import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from ruamel.yaml import YAML
 
 from skll.types import FoldMapping, PathOrStr
+from skll.utils.constants import MAX_CONCURRENT_PROCESSES
 from skll.utils.logging import get_skll_logger
 
+try:
+    import orjson
+except ImportError:
+    _HAVE_ORJSON = False
+else:
+    _HAVE_ORJSON = True
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    _HAVE_PYARROW = False
+else:
+    _HAVE_PYARROW = True
+
 # Turn off interactive plotting for matplotlib
 plt.ioff()
 
+# The plot style and the train and test colors used for all of the learning
+# curve plots; these are defined at the module level so that they are only
+# set up once and are also available in the parallel plotting processes
+_LEARNING_CURVE_STYLE = sns.axes_style(
+    "whitegrid", {"grid.linestyle": ":", "xtick.major.size": 3.0}
+)
+_LEARNING_CURVE_PALETTE = dict(
+    zip(["train_score_mean", "test_score_mean"], sns.color_palette(palette="Set1", n_colors=2))
+)
+
+
+# YAML loader for the featureset strings in the results files; we use
+# the C-based loader (if it is available) since it is much faster
+_yaml = YAML(typ="safe", pure=False)
+
+
+@lru_cache(maxsize=None)
+def _parse_featureset(featureset: str) -> FrozenSet[str]:
+    """
+    Parse the string representation of a featureset from a results file.
+
+    The parsed values are cached since ablation experiments produce the
+    same featureset strings over and over again.
+
+    Parameters
+    ----------
+    featureset : str
+        The string representation of the list of features.
+
+    Returns
+    -------
+    features : FrozenSet[str]
+        The set of features in the featureset.
+    """
+    return frozenset(_yaml.load(featureset))
+
+
+def _load_json_results(json_path: Path) -> List[Dict[str, Any]]:
+    """
+    Load the list of learner result dictionaries from a results JSON file.
+
+    If ``orjson`` is available, it is used to parse the file since it is
+    much faster than the standard library parser. However, since ``orjson``
+    does not accept the ``NaN`` values that may be present in SKLL results
+    files, we fall back to the standard library parser for such files.
+
+    Parameters
+    ----------
+    json_path : Path
+        The path to the results JSON file.
+
+    Returns
+    -------
+    learner_result_dicts : List[Dict[str, Any]]
+        The list of learner result dictionaries contained in the file.
+    """
+    if _HAVE_ORJSON:
+        json_bytes = json_path.read_bytes()
+        try:
+            return orjson.loads(json_bytes)
+        except orjson.JSONDecodeError:
+            return json.loads(json_bytes)
+    else:
+        with open(json_path) as json_file:
+            return json.load(json_file)
+
+
+def _squeeze_ylimits(
+    min_scores: np.ndarray, max_scores: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Squeeze the y-limits to hide unnecessary parts of learning curve plots.
+
+    The limits are set with a little buffer on either side but not too much.
+    All of the metrics are handled at once using vectorized operations.
+
+    Parameters
+    ----------
+    min_scores : numpy.ndarray
+        The minimum values that will be plotted for each metric.
+    max_scores : numpy.ndarray
+        The maximum values that will be plotted for each metric.
+
+    Returns
+    -------
+    limits : Tuple[numpy.ndarray, numpy.ndarray]
+        The lower and upper y-limits for each metric.
+    """
+    lower_limits = np.where(
+        min_scores < 0, np.maximum(min_scores - 0.1, np.floor(min_scores) - 0.05), 0.0
+    )
+    upper_limits = np.where(
+        max_scores > 0, np.minimum(max_scores + 0.1, np.ceil(max_scores) + 0.05), 0.0
+    )
+    return lower_limits, upper_limits
+
 
 def _compute_ylimits_for_featureset(
     df: pd.DataFrame, metrics: List[str]
@@ -52,37 +167,207 @@ def _compute_ylimits_for_featureset(
         A dictionary, with metric names as keys
         and a tuple of (lower_limit, upper_limit) as values.
     """
+    # compute the lower and upper edges of the shaded band for every row
+    # in one vectorized pass, using the standard deviation column that
+    # goes with the variable (train or test) of that row
+    values = df["value"].to_numpy()
+    stds = np.where(
+        df["variable"].to_numpy() == "train_score_mean",
+        df["train_score_std"].to_numpy(),
+        df["test_score_std"].to_numpy(),
+    )
+    df_bounds = pd.DataFrame(
+        {"metric": df["metric"].to_numpy(), "lower": values - stds, "upper": values + stds}
+    )
+
+    # get the real min and max for the values that will be plotted
+    # for each metric with a single groupby reduction
+    agg_df = df_bounds.groupby("metric", sort=False).agg({"lower": "min", "upper": "max"})
+    agg_df = agg_df.loc[metrics]
+    min_scores, max_scores = agg_df.to_numpy().T
+
     # set the y-limits of the curves depending on what kind
     # of values the metric produces
-    ylimits = {}
-    for metric in metrics:
-        # get the real min and max for the values that will be plotted
-        df_train = df[(df["variable"] == "train_score_mean") & (df["metric"] == metric)]
-        df_test = df[(df["variable"] == "test_score_mean") & (df["metric"] == metric)]
-        train_values_lower = df_train["value"].values - df_train["train_score_std"].values
-        test_values_lower = df_test["value"].values - df_test["test_score_std"].values
-        min_score = np.min(np.concatenate([train_values_lower, test_values_lower]))
-        train_values_upper = df_train["value"].values + df_train["train_score_std"].values
-        test_values_upper = df_test["value"].values + df_test["test_score_std"].values
-        max_score = np.max(np.concatenate([train_values_upper, test_values_upper]))
-
-        # squeeze the limits to hide unnecessary parts of the graph
-        # set the limits with a little buffer on either side but not too much
-        if min_score < 0:
-            lower_limit = max(min_score - 0.1, math.floor(min_score) - 0.05)
-        else:
-            lower_limit = 0
-
-        if max_score > 0:
-            upper_limit = min(max_score + 0.1, math.ceil(max_score) + 0.05)
-        else:
-            upper_limit = 0
-
-        ylimits[metric] = (lower_limit, upper_limit)
+    lower_limits, upper_limits = _squeeze_ylimits(min_scores, max_scores)
+    ylimits = dict(zip(agg_df.index, zip(lower_limits.tolist(), upper_limits.tolist())))
 
     return ylimits
 
 
+def _melt_learning_curve_data(df: pd.DataFrame, value_columns: List[str]) -> pd.DataFrame:
+    """
+    Convert learning curve data from wide to long format for plotting.
+
+    This is equivalent to calling ``pd.melt()`` with all of the other
+    columns as the ID variables, except that the long-form data frame is
+    built directly from the given columns and its "variable" column is
+    created as a categorical, thereby avoiding an extra copy of the data
+    and a separate conversion pass.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The wide-format data frame containing the learning curve data.
+    value_columns : List[str]
+        The columns to unpivot into the "variable" and "value" columns.
+
+    Returns
+    -------
+    df_melted : pandas.DataFrame
+        The long-format data frame with the "variable" and "value" columns.
+    """
+    id_columns = [column for column in df.columns if column not in value_columns]
+
+    # use the same (sorted) category order that ``astype("category")`` would
+    categories = sorted(value_columns)
+    df_parts = [
+        df[id_columns].assign(
+            variable=pd.Categorical.from_codes(
+                np.full(len(df), categories.index(column), dtype=np.int8), categories
+            ),
+            value=df[column].to_numpy(),
+        )
+        for column in value_columns
+    ]
+    df_melted = pd.concat(df_parts, ignore_index=True)
+
+    return df_melted
+
+
+def _generate_learning_curve_score_plot(
+    fs_name: str,
+    df_fs: pd.DataFrame,
+    num_metrics: int,
+    num_learners: int,
+    experiment_name: str,
+    output_dir: Path,
+    rotate_labels: bool,
+) -> None:
+    """
+    Generate the learning curve score plot for a single featureset.
+
+    Parameters
+    ----------
+    fs_name : str
+        The name of the featureset.
+    df_fs : pandas.DataFrame
+        The pandas data frame containing the scores for this featureset.
+    num_metrics : int
+        The number of metrics specified in the experiment.
+    num_learners: int
+        The number of learners specified in the experiment.
+    experiment_name : str
+        The name of the experiment.
+    output_dir : Path
+        Path to the output directory for the plot.
+    rotate_labels : bool
+        Whether to rotate the x-axis labels for the training data size.
+    """
+    # the metrics go along the rows and the learners along the columns
+    row_names = list(df_fs["metric"].unique())
+    col_names = list(df_fs["learner_name"].cat.categories)
+
+    # compute ylimits for this feature set for each objective
+    ylimits = _compute_ylimits_for_featureset(df_fs, row_names)
+
+    # split the data for this feature set into the individual
+    # train and test curves once instead of re-filtering per axis
+    groups = {
+        key: df_group
+        for key, df_group in df_fs.groupby(
+            ["learner_name", "metric", "variable"], sort=False, observed=True
+        )
+    }
+
+    train_color = _LEARNING_CURVE_PALETTE["train_score_mean"]
+    test_color = _LEARNING_CURVE_PALETTE["test_score_mean"]
+    with _LEARNING_CURVE_STYLE:
+        # draw the axes directly instead of using a facet grid since
+        # we already have the data for each of the axes from above; we
+        # only ever save the plots to files so we render them with the
+        # Agg canvas directly without going through pyplot and the
+        # globally configured backend
+        fig = Figure(figsize=(2.5 * num_learners, 2.5 * num_metrics))
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(num_metrics, num_learners, squeeze=False)
+        for i, row_name in enumerate(row_names):
+            for j, col_name in enumerate(col_names):
+                ax = axes[i][j]
+                df_ax_train = groups.get((col_name, row_name, "train_score_mean"))
+                df_ax_test = groups.get((col_name, row_name, "test_score_mean"))
+
+                # this featureset may not have any results for this learner
+                # and metric in which case we leave the axis empty
+                if df_ax_train is not None and df_ax_test is not None:
+                    # draw the test curve first so that the train curve is on top
+                    for df_ax, color in [(df_ax_test, test_color), (df_ax_train, train_color)]:
+                        sns.pointplot(
+                            data=df_ax,
+                            x="training_set_size",
+                            y="value",
+                            color=color,
+                            scale=0.5,
+                            errorbar=None,
+                            ax=ax,
+                        )
+
+                    # the train and test curves have one point per training set size
+                    x = np.arange(len(df_ax_train))
+                    train_values = df_ax_train["value"].to_numpy()
+                    train_stds = df_ax_train["train_score_std"].to_numpy()
+                    test_values = df_ax_test["value"].to_numpy()
+                    test_stds = df_ax_test["test_score_std"].to_numpy()
+                    ax.fill_between(
+                        x,
+                        train_values - train_stds,
+                        train_values + train_stds,
+                        alpha=0.1,
+                        rasterized=True,
+                        color=train_color,
+                    )
+                    ax.fill_between(
+                        x,
+                        test_values - test_stds,
+                        test_values + test_stds,
+                        alpha=0.1,
+                        rasterized=True,
+                        color=test_color,
+                    )
+                else:
+                    # do not show a made-up x-axis on the empty axis
+                    ax.set_xticks([])
+
+                ax.set(ylim=ylimits[row_name])
+
+                # set the titles and the labels on the outer axes only
+                if i == 0:
+                    ax.set_title(col_name, size=plt.rcParams["axes.labelsize"])
+                ax.set_xlabel("Training Examples" if i == len(row_names) - 1 else "")
+                ax.set_ylabel(row_name if j == 0 else "")
+                if rotate_labels:
+                    ax.tick_params(axis="x", labelrotation=60)
+
+                if i == 0 and j == 0:
+                    # set up the legend handles for this plot
+                    plot_handles = [
+                        matplotlib.lines.Line2D([], [], color=color, label=label, linestyle="-")
+                        for color, label in zip(
+                            [train_color, test_color], ["Training", "Cross-validation"]
+                        )
+                    ]
+                    ax.legend(
+                        handles=plot_handles,
+                        loc=4,
+                        fancybox=True,
+                        fontsize="x-small",
+                        ncol=1,
+                        frameon=True,
+                    )
+        sns.despine(fig=fig)
+        fig.tight_layout(w_pad=1)
+        fig.savefig(output_dir / f"{experiment_name}_{fs_name}.png", dpi=300)
+
+
 def _generate_learning_curve_score_plots(
     df_scores: pd.DataFrame,
     num_metrics: int,
@@ -117,97 +402,122 @@ def _generate_learning_curve_score_plots(
     # convert output dir to a path
     output_dir = Path(output_dir)
 
+    # only keep the columns that we need for the plots so that
+    # each of the featureset groups below is as small as possible
+    df_scores = df_scores[
+        [
+            "featureset_name",
+            "learner_name",
+            "metric",
+            "variable",
+            "value",
+            "train_score_std",
+            "test_score_std",
+            "training_set_size",
+        ]
+    ]
+
     # set up and draw the actual learning curve figures, one for
-    # each of the featuresets
-    for fs_name, df_fs in df_scores.groupby("featureset_name"):
-        fig = plt.figure()
-        fig.set_size_inches(2.5 * num_learners, 2.5 * num_metrics)
-
-        # compute ylimits for this feature set for each objective
-        with sns.axes_style("whitegrid", {"grid.linestyle": ":", "xtick.major.size": 3.0}):
-            g = sns.FacetGrid(
-                df_fs,
-                row="metric",
-                col="learner_name",
-                height=2.5,
-                aspect=1,
-                margin_titles=True,
-                despine=True,
-                sharex=False,
-                sharey=False,
-                legend_out=False,
-            )
-            train_color, test_color = sns.color_palette(palette="Set1", n_colors=2)
-            g = g.map_dataframe(
-                sns.pointplot,
-                x="training_set_size",
-                y="value",
-                hue="variable",
-                scale=0.5,
-                errorbar=None,
-                palette={"train_score_mean": train_color, "test_score_mean": test_color},
-            )
-            ylimits = _compute_ylimits_for_featureset(df_fs, g.row_names)
-            for ax in g.axes.flat:
-                plt.setp(ax.texts, text="")
-            g = g.set_titles(row_template="", col_template="{col_name}").set_axis_labels(
-                "Training Examples", "Score"
-            )
+    # each of the featuresets; since the figures are independent
+    # of each other, we draw them in parallel but limit the number
+    # of parallel jobs to be no higher than the number of featuresets,
+    # the number of cores, or MAX_CONCURRENT_PROCESSES, whichever is lowest
+    df_fs_groups = list(df_scores.groupby("featureset_name", observed=True))
+    if not df_fs_groups:
+        return
+
+    n_jobs = min(cpu_count(), MAX_CONCURRENT_PROCESSES, len(df_fs_groups))
+    parallel = joblib.Parallel(n_jobs=n_jobs, pre_dispatch=n_jobs)
+    parallel(
+        joblib.delayed(_generate_learning_curve_score_plot)(
+            fs_name, df_fs, num_metrics, num_learners, experiment_name, output_dir, rotate_labels
+        )
+        for fs_name, df_fs in df_fs_groups
+    )
+
+
+def _generate_learning_curve_time_plot(
+    fs_name: str,
+    df_fs: pd.DataFrame,
+    num_learners: int,
+    experiment_name: str,
+    output_dir: Path,
+    rotate_labels: bool,
+) -> None:
+    """
+    Generate the learning curve time plot for a single featureset.
+
+    Parameters
+    ----------
+    fs_name : str
+        The name of the featureset.
+    df_fs : pandas.DataFrame
+        The pandas data frame containing the fit times for this featureset.
+    num_learners: int
+        The number of learners specified in the experiment.
+    experiment_name : str
+        The name of the experiment.
+    output_dir : Path
+        Path to the output directory for the plot.
+    rotate_labels : bool
+        Whether to rotate the x-axis labels for the training data size.
+    """
+    # the learners go along the columns
+    col_names = list(df_fs["learner_name"].cat.categories)
+
+    # split the data for this feature set into the individual
+    # learner curves once instead of re-filtering per axis; the
+    # only variable in this data frame is "fit_time_mean"
+    groups = {
+        key: df_group for key, df_group in df_fs.groupby("learner_name", sort=False, observed=True)
+    }
+
+    with _LEARNING_CURVE_STYLE:
+        # draw the axes directly on an Agg canvas just like the score plots
+        fig = Figure(figsize=(2.5 * num_learners, 2.5))
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(1, num_learners, sharey=True, squeeze=False)
+        for j, col_name in enumerate(col_names):
+            ax = axes[0][j]
+            df_ax = groups.get(col_name)
+
+            # this featureset may not have any results for this learner
+            # in which case we leave the axis empty
+            if df_ax is not None:
+                sns.pointplot(
+                    data=df_ax,
+                    x="training_set_size",
+                    y="value",
+                    color=".15",
+                    scale=0.5,
+                    errorbar=None,
+                    ax=ax,
+                )
+
+                # compute the upper and lower
+                values = df_ax["value"].to_numpy()
+                stds = df_ax["fit_time_std"].to_numpy()
+                ax.fill_between(
+                    np.arange(len(df_ax)),
+                    values - stds,
+                    values + stds,
+                    alpha=0.1,
+                    rasterized=True,
+                )
+            else:
+                # do not show a made-up x-axis on the empty axis
+                ax.set_xticks([])
+
+            # set the titles and the labels on the outer axes only
+            ax.set_title(col_name, size=plt.rcParams["axes.labelsize"])
+            ax.set_xlabel("Training Examples")
+            ax.set_ylabel("Fit time (s)" if j == 0 else "")
             if rotate_labels:
-                g = g.set_xticklabels(rotation=60)
-
-            for i, row_name in enumerate(g.row_names):
-                for j, col_name in enumerate(g.col_names):
-                    ax = g.axes[i][j]
-                    ax.set(ylim=ylimits[row_name])
-                    df_ax_train = df_fs[
-                        (df_fs["learner_name"] == col_name)
-                        & (df_fs["metric"] == row_name)
-                        & (df_fs["variable"] == "train_score_mean")
-                    ]
-                    df_ax_test = df_fs[
-                        (df_fs["learner_name"] == col_name)
-                        & (df_fs["metric"] == row_name)
-                        & (df_fs["variable"] == "test_score_mean")
-                    ]
-                    ax.fill_between(
-                        list(range(len(df_ax_train))),
-                        df_ax_train["value"] - df_ax_train["train_score_std"],
-                        df_ax_train["value"] + df_ax_train["train_score_std"],
-                        alpha=0.1,
-                        color=train_color,
-                    )
-                    ax.fill_between(
-                        list(range(len(df_ax_test))),
-                        df_ax_test["value"] - df_ax_test["test_score_std"],
-                        df_ax_test["value"] + df_ax_test["test_score_std"],
-                        alpha=0.1,
-                        color=test_color,
-                    )
-                    if j == 0:
-                        ax.set_ylabel(row_name)
-                        if i == 0:
-                            # set up the legend handles for this plot
-                            plot_handles = [
-                                matplotlib.lines.Line2D(
-                                    [], [], color=color, label=label, linestyle="-"
-                                )
-                                for color, label in zip(
-                                    [train_color, test_color], ["Training", "Cross-validation"]
-                                )
-                            ]
-                            ax.legend(
-                                handles=plot_handles,
-                                loc=4,
-                                fancybox=True,
-                                fontsize="x-small",
-                                ncol=1,
-                                frameon=True,
-                            )
-            g.fig.tight_layout(w_pad=1)
-            plt.savefig(output_dir / f"{experiment_name}_{fs_name}.png", dpi=300)
-            # explicitly close figure to save memory
-            plt.close(fig)
+                ax.tick_params(axis="x", labelrotation=60)
+
+        sns.despine(fig=fig)
+        fig.tight_layout(w_pad=1)
+        fig.savefig(output_dir / f"{experiment_name}_{fs_name}_times.png", dpi=300)
 
 
 def _generate_learning_curve_time_plots(
@@ -241,59 +551,36 @@ def _generate_learning_curve_time_plots(
     # convert output dir to a path
     output_dir = Path(output_dir)
 
-    # set up and draw the actual learning curve figures, one for
-    # each of the featuresets
-    for fs_name, df_fs in df_times.groupby("featureset_name"):
-        fig = plt.figure()
-        fig.set_size_inches(2.5 * num_learners, 2.5)
-
-        # compute ylimits for this feature set for each metric
-        with sns.axes_style("whitegrid", {"grid.linestyle": ":", "xtick.major.size": 3.0}):
-            g = sns.FacetGrid(
-                df_fs,
-                col="learner_name",
-                height=2.5,
-                aspect=1,
-                margin_titles=True,
-                despine=True,
-                sharex=False,
-                sharey=True,
-                legend_out=False,
-            )
-            g = g.map_dataframe(
-                sns.pointplot,
-                x="training_set_size",
-                y="value",
-                hue="variable",
-                scale=0.5,
-                errorbar=None,
-            )
-            # compute the upper and lower
-            for ax in g.axes.flat:
-                plt.setp(ax.texts, text="")
-            g = g.set_titles(row_template="", col_template="{col_name}").set_axis_labels(
-                "Training Examples", "Fit time (s)"
-            )
-            if rotate_labels:
-                g = g.set_xticklabels(rotation=60)
-
-            for j, col_name in enumerate(g.col_names):
-                ax = g.axes[0][j]
-                df_ax = df_fs[
-                    (df_fs["learner_name"] == col_name) & (df_fs["variable"] == "fit_time_mean")
-                ]
-                ax.fill_between(
-                    list(range(len(df_ax))),
-                    df_ax["value"] - df_ax["fit_time_std"],
-                    df_ax["value"] + df_ax["fit_time_std"],
-                    alpha=0.1,
-                )
-
-            g.fig.tight_layout(w_pad=1)
-            plt.savefig(output_dir / f"{experiment_name}_{fs_name}_times.png", dpi=300)
+    # only keep the columns that we need for the plots so that
+    # each of the featureset groups below is as small as possible
+    df_times = df_times[
+        [
+            "featureset_name",
+            "learner_name",
+            "variable",
+            "value",
+            "fit_time_std",
+            "training_set_size",
+        ]
+    ]
 
-            # explicitly close figure to save memory
-            plt.close(fig)
+    # set up and draw the actual learning curve figures, one for
+    # each of the featuresets; since the figures are independent
+    # of each other, we draw them in parallel but limit the number
+    # of parallel jobs to be no higher than the number of featuresets,
+    # the number of cores, or MAX_CONCURRENT_PROCESSES, whichever is lowest
+    df_fs_groups = list(df_times.groupby("featureset_name", observed=True))
+    if not df_fs_groups:
+        return
+
+    n_jobs = min(cpu_count(), MAX_CONCURRENT_PROCESSES, len(df_fs_groups))
+    parallel = joblib.Parallel(n_jobs=n_jobs, pre_dispatch=n_jobs)
+    parallel(
+        joblib.delayed(_generate_learning_curve_time_plot)(
+            fs_name, df_fs, num_learners, experiment_name, output_dir, rotate_labels
+        )
+        for fs_name, df_fs in df_fs_groups
+    )
 
 
 def generate_learning_curve_plots(
@@ -303,6 +590,7 @@ def generate_learning_curve_plots(
     Generate learning curves using the TSV output file from a learning curve experiment.
 
     This function generates both the score plots as well as the fit time plots.
+    The fit time plots are only generated if the TSV file contains fit times.
 
     Parameters
     ----------
@@ -317,8 +605,28 @@ def generate_learning_curve_plots(
     output_dir = Path(output_dir)
 
     # use pandas to read in the TSV file into a data frame
-    # and massage it from wide to long format for plotting
-    df = pd.read_csv(learning_curve_tsv_file, sep="\t")
+    # and massage it from wide to long format for plotting;
+    # we use explicit types so that pandas does not need to
+    # infer them and the faster pyarrow engine, if available;
+    # note that the "learner_name" column is categorical so
+    # that it's sorted correctly in the plots
+    df = pd.read_csv(
+        learning_curve_tsv_file,
+        sep="\t",
+        engine="pyarrow" if _HAVE_PYARROW else "c",
+        dtype={
+            "featureset_name": "category",
+            "learner_name": "category",
+            "train_set_name": "category",
+            "training_set_size": "int32",
+            "train_score_mean": "float64",
+            "train_score_std": "float64",
+            "test_score_mean": "float64",
+            "test_score_std": "float64",
+            "fit_time_mean": "float64",
+            "fit_time_std": "float64",
+        },
+    )
     num_learners = len(df["learner_name"].unique())
     num_metrics = len(df["metric"].unique())
 
@@ -328,23 +636,12 @@ def generate_learning_curve_plots(
     rotate_labels = df["training_set_size"].unique().max() >= 1000
 
     # get the columns relevant to the two types of plots
-    score_columns = [
-        column
-        for column in df.columns
-        if column
-        not in [
-            "train_set_name",
-            "fit_time_mean",
-            "fit_time_std",
-            "scikit_learn_version",
-            "version",
-        ]
-    ]
-    time_columns = [
-        column
-        for column in df.columns
-        if column
-        not in [
+    score_columns = df.columns.difference(
+        ["train_set_name", "fit_time_mean", "fit_time_std", "scikit_learn_version", "version"],
+        sort=False,
+    )
+    time_columns = df.columns.difference(
+        [
             "train_set_name",
             "train_score_mean",
             "train_score_std",
@@ -352,47 +649,15 @@ def generate_learning_curve_plots(
             "test_score_std",
             "scikit_learn_version",
             "version",
-        ]
-    ]
-
-    # create the score-specific data frame
-    df_score = df[score_columns].copy()
-    df_score_melted = pd.melt(
-        df_score,
-        id_vars=[c for c in df_score.columns if c not in ["train_score_mean", "test_score_mean"]],
-    )
-    # make sure the "variable" column is categorical since it will be
-    # mapped to hue levels in the learning curve below
-    df_score_melted["variable"] = df_score_melted["variable"].astype("category")
-
-    # also make sure that the "learner_name" column is categorical so that
-    # it's sorted correctly
-    df_score_melted["learner_name"] = df_score_melted["learner_name"].astype("category")
-
-    # now compute the time-specific data frame
-    df_time = df[time_columns].copy()
-
-    # note that although we have already averaged the fit times over
-    # the various training, we still have multiple fit times for each
-    # of the metrics so we can further average those out
-    df_time_indexed = df_time.set_index(
-        ["featureset_name", "learner_name", "training_set_size", "metric"]
-    )
-    df_time = (
-        df_time_indexed.groupby(level=["featureset_name", "learner_name", "training_set_size"])
-        .mean()
-        .reset_index()
+        ],
+        sort=False,
     )
 
-    # now let's melt the time data frame the same way that we did the score one
-    df_time_melted = pd.melt(
-        df_time,
-        id_vars=[c for c in df_time.columns if c != "fit_time_mean"],
-    )
-
-    # also make sure that the "learner_name" column is categorical so that
-    # it's sorted correctly
-    df_time_melted["learner_name"] = df_time_melted["learner_name"].astype("category")
+    # create the score-specific data frame; note that the "variable" column
+    # is categorical since it will be mapped to hue levels in the learning
+    # curve below; no copy is needed since the melting creates a new frame
+    df_score = df[score_columns]
+    df_score_melted = _melt_learning_curve_data(df_score, ["train_score_mean", "test_score_mean"])
 
     # call the function to generate the score plots first
     _generate_learning_curve_score_plots(
@@ -404,14 +669,40 @@ def generate_learning_curve_plots(
         rotate_labels=rotate_labels,
     )
 
-    # now call the function to generate the time plots
-    _generate_learning_curve_time_plots(
-        df_time_melted,
-        num_learners,
-        experiment_name,
-        output_dir,
-        rotate_labels=rotate_labels,
-    )
+    # now compute the time-specific data frame and generate the time plots;
+    # older learning curve TSV files do not have any fit time columns in
+    # which case we only generate the score plots
+    if "fit_time_mean" in df.columns:
+        # no copy is needed since the grouping below creates a new frame
+        df_time = df[time_columns]
+
+        # note that although we have already averaged the fit times over
+        # the various training, we still have multiple fit times for each
+        # of the metrics so we can further average those out; we group
+        # on the columns directly rather than building a multi-index and
+        # the name columns are already categorical to make the grouping cheaper
+        df_time = (
+            df_time.drop(columns=["metric"])
+            .groupby(
+                ["featureset_name", "learner_name", "training_set_size"],
+                as_index=False,
+                sort=False,
+                observed=True,
+            )
+            .mean(numeric_only=True)
+        )
+
+        # now let's melt the time data frame the same way that we did the score one
+        df_time_melted = _melt_learning_curve_data(df_time, ["fit_time_mean"])
+
+        # now call the function to generate the time plots
+        _generate_learning_curve_time_plots(
+            df_time_melted,
+            num_learners,
+            experiment_name,
+            output_dir,
+            rotate_labels=rotate_labels,
+        )
 
 
 def _print_fancy_output(
@@ -430,76 +721,81 @@ def _print_fancy_output(
     if not learner_result_dicts:
         raise ValueError("Result dictionary list is empty!")
 
+    # build up the lines of each block and write each block out at once
     lrd = learner_result_dicts[0]
-    print(f'Experiment Name: {lrd["experiment_name"]}', file=output_file)
-    print(f'SKLL Version: {lrd["version"]}', file=output_file)
-    print(f'Training Set: {lrd["train_set_name"]}', file=output_file)
-    print(f'Training Set Size: {lrd["train_set_size"]}', file=output_file)
-    print(f'Test Set: {lrd["test_set_name"]}', file=output_file)
-    print(f'Test Set Size: {lrd["test_set_size"]}', file=output_file)
-    print(f'Shuffle: {lrd["shuffle"]}', file=output_file)
-    print(f'Feature Set: {lrd["featureset"]}', file=output_file)
-    print(f'Learner: {lrd["learner_name"]}', file=output_file)
-    print(f'Task: {lrd["task"]}', file=output_file)
+    lines = [
+        f'Experiment Name: {lrd["experiment_name"]}',
+        f'SKLL Version: {lrd["version"]}',
+        f'Training Set: {lrd["train_set_name"]}',
+        f'Training Set Size: {lrd["train_set_size"]}',
+        f'Test Set: {lrd["test_set_name"]}',
+        f'Test Set Size: {lrd["test_set_size"]}',
+        f'Shuffle: {lrd["shuffle"]}',
+        f'Feature Set: {lrd["featureset"]}',
+        f'Learner: {lrd["learner_name"]}',
+        f'Task: {lrd["task"]}',
+    ]
     if lrd["folds_file"]:
-        print(f'Specified Folds File: {lrd["folds_file"]}', file=output_file)
+        lines.append(f'Specified Folds File: {lrd["folds_file"]}')
     if lrd["task"] == "cross_validate":
-        print(f'Number of Folds: {lrd["cv_folds"]}', file=output_file)
+        lines.append(f'Number of Folds: {lrd["cv_folds"]}')
         if not lrd["cv_folds"].endswith("folds file"):
-            print(f'Stratified Folds: {lrd["stratified_folds"]}', file=output_file)
-    print(f'Feature Scaling: {lrd["feature_scaling"]}', file=output_file)
-    print(f'Grid Search: {lrd["grid_search"]}', file=output_file)
+            lines.append(f'Stratified Folds: {lrd["stratified_folds"]}')
+    lines.append(f'Feature Scaling: {lrd["feature_scaling"]}')
+    lines.append(f'Grid Search: {lrd["grid_search"]}')
     if lrd["grid_search"]:
-        print(f'Grid Search Folds: {lrd["grid_search_folds"]}', file=output_file)
-        print(f'Grid Objective Function: {lrd["grid_objective"]}', file=output_file)
+        lines.append(f'Grid Search Folds: {lrd["grid_search_folds"]}')
+        lines.append(f'Grid Objective Function: {lrd["grid_objective"]}')
     if (
         lrd["task"] == "cross_validate"
         and lrd["grid_search"]
         and lrd["cv_folds"].endswith("folds file")
     ):
-        print(
-            "Using Folds File for Grid Search: " f'{lrd["use_folds_file_for_grid_search"]}',
-            file=output_file,
+        lines.append(
+            "Using Folds File for Grid Search: " f'{lrd["use_folds_file_for_grid_search"]}'
         )
     if lrd["task"] in ["evaluate", "cross_validate"] and lrd["additional_scores"]:
-        print(
-            "Additional Evaluation Metrics: " f'{list(lrd["additional_scores"].keys())}',
-            file=output_file,
-        )
-    print(f'Scikit-learn Version: {lrd["scikit_learn_version"]}', file=output_file)
-    print(f'Start Timestamp: {lrd["start_timestamp"]}', file=output_file)
-    print(f'End Timestamp: {lrd["end_timestamp"]}', file=output_file)
-    print(f'Total Time: {lrd["total_time"]}', file=output_file)
-    print("\n", file=output_file)
+        lines.append("Additional Evaluation Metrics: " f'{list(lrd["additional_scores"].keys())}')
+    lines.append(f'Scikit-learn Version: {lrd["scikit_learn_version"]}')
+    lines.append(f'Start Timestamp: {lrd["start_timestamp"]}')
+    lines.append(f'End Timestamp: {lrd["end_timestamp"]}')
+    lines.append(f'Total Time: {lrd["total_time"]}')
+    lines.append("\n")
+    output_file.write("\n".join(lines) + "\n")
+    lines.clear()
 
     for lrd in learner_result_dicts:
-        print(f'Fold: {lrd["fold"]}', file=output_file)
-        print(f'Model Parameters: {lrd.get("model_params", "")}', file=output_file)
-        print(f'Grid Objective Score (Train) = {lrd.get("grid_score", "")}', file=output_file)
+        lines.append(f'Fold: {lrd["fold"]}')
+        lines.append(f'Model Parameters: {lrd.get("model_params", "")}')
+        lines.append(f'Grid Objective Score (Train) = {lrd.get("grid_score", "")}')
         if "result_table" in lrd:
-            print(lrd["result_table"], file=output_file)
-            print(f'Accuracy = {lrd["accuracy"]}', file=output_file)
+            lines.append(str(lrd["result_table"]))
+            lines.append(f'Accuracy = {lrd["accuracy"]}')
         if "descriptive" in lrd:
-            print("Descriptive statistics:", file=output_file)
-            for desc_stat in ["min", "max", "avg", "std"]:
-                actual = lrd["descriptive"]["actual"][desc_stat]
-                predicted = lrd["descriptive"]["predicted"][desc_stat]
-                print(
-                    f" {desc_stat.title()} = {actual:.4f} (actual), "
-                    f"{predicted:.4f} (predicted)",
-                    file=output_file,
-                )
-            print(f'Pearson = {lrd["pearson"]:f}', file=output_file)
-        print(f'Objective Function Score (Test) = {lrd.get("score", "")}', file=output_file)
+            actual = lrd["descriptive"]["actual"]
+            predicted = lrd["descriptive"]["predicted"]
+            lines.append("Descriptive statistics:")
+            lines.extend(
+                [
+                    f" {desc_stat.title()} = {actual[desc_stat]:.4f} "
+                    f"(actual), {predicted[desc_stat]:.4f} (predicted)"
+                    for desc_stat in ("min", "max", "avg", "std")
+                ]
+            )
+            lines.append(f'Pearson = {lrd["pearson"]:f}')
+        lines.append(f'Objective Function Score (Test) = {lrd.get("score", "")}')
 
         # now print the additional metrics, if there were any
-        if lrd["additional_scores"]:
-            print("", file=output_file)
-            print("Additional Evaluation Metrics (Test):", file=output_file)
-            for metric, score in lrd["additional_scores"].items():
+        additional_scores = lrd["additional_scores"]
+        if additional_scores:
+            lines.append("")
+            lines.append("Additional Evaluation Metrics (Test):")
+            for metric, score in additional_scores.items():
                 score = "" if np.isnan(score) else score
-                print(f" {metric} = {score}", file=output_file)
-        print("", file=output_file)
+                lines.append(f" {metric} = {score}")
+        lines.append("")
+        output_file.write("\n".join(lines) + "\n")
+        lines.clear()
 
 
 def _write_learning_curve_file(result_json_paths: List[str], output_file: IO[str]) -> None:
@@ -516,12 +812,11 @@ def _write_learning_curve_file(result_json_paths: List[str], output_file: IO[str
     output_file : IO[str]
         The file buffer to write to.
     """
-    learner_result_dicts = []
+    json_paths = [Path(json_path_str) for json_path_str in result_json_paths]
 
-    # Map from feature set names to all features in them
+    # make sure that all of the results files exist before writing anything
     logger = get_skll_logger("experiment")
-    for json_path_str in result_json_paths:
-        json_path = Path(json_path_str)
+    for json_path in json_paths:
         if not json_path.exists():
             logger.error(
                 f"JSON results file {json_path} not found. Skipping "
@@ -530,12 +825,8 @@ def _write_learning_curve_file(result_json_paths: List[str], output_file: IO[str
                 "summarize_results script."
             )
             return
-        else:
-            with open(json_path) as json_file:
-                obj = json.load(json_file)
-                learner_result_dicts.extend(obj)
 
-    # Build and write header
+    # Build header
     header = [
         "featureset_name",
         "learner_name",
@@ -551,50 +842,49 @@ def _write_learning_curve_file(result_json_paths: List[str], output_file: IO[str
         "scikit_learn_version",
         "version",
     ]
-    writer = csv.DictWriter(output_file, header, extrasaction="ignore", dialect=csv.excel_tab)
-    writer.writeheader()
 
-    # write out the fields we need for the learning curve file
-    # specifically, we need to separate out the curve sizes
-    # and scores into individual entries.
-    for lrd in learner_result_dicts:
-        training_set_sizes = lrd["computed_curve_train_sizes"]
-        train_scores_means_by_size = lrd["learning_curve_train_scores_means"]
-        test_scores_means_by_size = lrd["learning_curve_test_scores_means"]
-        fit_times_means_by_size = lrd["learning_curve_fit_times_means"]
-        train_scores_stds_by_size = lrd["learning_curve_train_scores_stds"]
-        test_scores_stds_by_size = lrd["learning_curve_test_scores_stds"]
-        fit_times_stds_by_size = lrd["learning_curve_fit_times_stds"]
-
-        # rename `grid_objective` to `metric` since the latter name can be confusing
-        lrd["metric"] = lrd["grid_objective"]
-
-        for (
-            size,
-            train_score_mean,
-            test_score_mean,
-            fit_time_mean,
-            train_score_std,
-            test_score_std,
-            fit_time_std,
-        ) in zip(
-            training_set_sizes,
-            train_scores_means_by_size,
-            test_scores_means_by_size,
-            fit_times_means_by_size,
-            train_scores_stds_by_size,
-            test_scores_stds_by_size,
-            fit_times_stds_by_size,
-        ):
-            lrd["training_set_size"] = size
-            lrd["train_score_mean"] = train_score_mean
-            lrd["test_score_mean"] = test_score_mean
-            lrd["fit_time_mean"] = fit_time_mean
-            lrd["train_score_std"] = train_score_std
-            lrd["test_score_std"] = test_score_std
-            lrd["fit_time_std"] = fit_time_std
-
-            writer.writerow(lrd)
+    # map the columns that vary with the training set size to
+    # the result dictionary keys that contain their values
+    curve_columns = {
+        "training_set_size": "computed_curve_train_sizes",
+        "train_score_mean": "learning_curve_train_scores_means",
+        "test_score_mean": "learning_curve_test_scores_means",
+        "fit_time_mean": "learning_curve_fit_times_means",
+        "train_score_std": "learning_curve_train_scores_stds",
+        "test_score_std": "learning_curve_test_scores_stds",
+        "fit_time_std": "learning_curve_fit_times_stds",
+    }
+
+    # create the data frame with the fields we need for the learning curve
+    # file; specifically, we need to separate out the curve sizes and scores
+    # into individual rows which we do by creating a data frame directly from
+    # the parallel lists for each result dictionary and then broadcasting the
+    # remaining fields as scalars
+    df_curves = []
+    for json_path in json_paths:
+        for lrd in _load_json_results(json_path):
+            # rename `grid_objective` to `metric` since the latter name can be confusing
+            lrd["metric"] = lrd["grid_objective"]
+            df_curve = pd.DataFrame({column: lrd[key] for column, key in curve_columns.items()})
+            for column in header:
+                if column not in curve_columns:
+                    df_curve[column] = lrd.get(column, "")
+            df_curves.append(df_curve)
+
+    # write out the combined data frame in one go; note that we write out
+    # any missing values as "nan" just like the `csv` module would
+    if df_curves:
+        df_output = pd.concat(df_curves, ignore_index=True)
+    else:
+        df_output = pd.DataFrame(columns=header)
+    df_output.to_csv(
+        output_file,
+        sep="\t",
+        index=False,
+        columns=header,
+        na_rep="nan",
+        lineterminator="\r\n",
+    )
 
     output_file.flush()
 
@@ -612,8 +902,7 @@ def _write_skll_folds(skll_fold_ids: FoldMapping, skll_fold_ids_file: IO[str]) -
     """
     f = csv.writer(skll_fold_ids_file)
     f.writerow(["id", "cv_test_fold"])
-    for example_id in skll_fold_ids:
-        f.writerow([example_id, skll_fold_ids[example_id]])
+    f.writerows(skll_fold_ids.items())
 
     skll_fold_ids_file.flush()
 
@@ -634,14 +923,13 @@ def _write_summary_file(result_json_paths: List[str], output_file: IO[str], abla
     ablation : int, default=0
         The number of features to remove when doing ablation experiment.
     """
-    learner_result_dicts = []
+    json_paths = [Path(json_path_str) for json_path_str in result_json_paths]
     # Map from feature set names to all features in them
-    all_features = defaultdict(set)
+    all_features: Dict[str, FrozenSet[str]] = {}
     logger = get_skll_logger("experiment")
-    yaml = YAML(typ="safe", pure=True)
 
-    for json_path_str in result_json_paths:
-        json_path = Path(json_path_str)
+    # make sure that all of the results files exist before writing anything
+    for json_path in json_paths:
         if not json_path.exists():
             logger.error(
                 f"JSON results file {json_path} not found. Skipping "
@@ -650,34 +938,51 @@ def _write_summary_file(result_json_paths: List[str], output_file: IO[str], abla
                 "summarize_results script."
             )
             return
-        else:
-            with open(json_path) as json_file:
-                obj = json.load(json_file)
-                featureset_name = obj[0]["featureset_name"]
-                if ablation != 0 and "_minus_" in featureset_name:
-                    parent_set = featureset_name.split("_minus_", 1)[0]
-                    all_features[parent_set].update(yaml.load(obj[0]["featureset"]))
-                learner_result_dicts.extend(obj)
-
-    # Build and write header
-    unique_columns = set(learner_result_dicts[0].keys()) - {"result_table", "descriptive"}
+
+    # for ablation experiments, we need to know all of the features
+    # in each parent feature set before we can write out any rows
     if ablation != 0:
-        unique_columns.add("ablated_features")
-    header = sorted(unique_columns)
-    writer = csv.DictWriter(output_file, header, extrasaction="ignore", dialect=csv.excel_tab)
-    writer.writeheader()
+        parsed_per_parent: Dict[str, List[FrozenSet[str]]] = defaultdict(list)
+        for json_path in json_paths:
+            obj = _load_json_results(json_path)
+            featureset_name = obj[0]["featureset_name"]
+            if "_minus_" in featureset_name:
+                parent_set = featureset_name.split("_minus_", 1)[0]
+                parsed_per_parent[parent_set].append(_parse_featureset(obj[0]["featureset"]))
+        all_features = {
+            parent_set: frozenset().union(*featuresets)
+            for parent_set, featuresets in parsed_per_parent.items()
+        }
+
+    # write out the rows one results file at a time so that
+    # we never hold all of them in memory
+    writer = None
+    for json_path in json_paths:
+        learner_result_dicts = _load_json_results(json_path)
+
+        # Build and write header using the first results file
+        if writer is None:
+            unique_columns = set(learner_result_dicts[0].keys()) - {"result_table", "descriptive"}
+            if ablation != 0:
+                unique_columns.add("ablated_features")
+            header = sorted(unique_columns)
+            writer = csv.DictWriter(
+                output_file, header, extrasaction="ignore", dialect=csv.excel_tab
+            )
+            writer.writeheader()
 
-    # Build "ablated_features" list and fix some backward compatible things
-    for lrd in learner_result_dicts:
-        featureset_name = lrd["featureset_name"]
+        # Build "ablated_features" list and fix some backward compatible things
         if ablation != 0:
-            parent_set = featureset_name.split("_minus_", 1)[0]
-            ablated_features = all_features[parent_set].difference(yaml.load(lrd["featureset"]))
-            lrd["ablated_features"] = ""
-            if ablated_features:
-                lrd["ablated_features"] = json.dumps(sorted(ablated_features))
-
-        # write out the new learner dict with the readable fields
-        writer.writerow(lrd)
+            for lrd in learner_result_dicts:
+                parent_set = lrd["featureset_name"].split("_minus_", 1)[0]
+                ablated_features = all_features.get(parent_set, frozenset()).difference(
+                    _parse_featureset(lrd["featureset"])
+                )
+                lrd["ablated_features"] = ""
+                if ablated_features:
+                    lrd["ablated_features"] = json.dumps(sorted(ablated_features))
+
+        # write out the new learner dicts with the readable fields
+        writer.writerows(learner_result_dicts)
 
     output_file.flush()
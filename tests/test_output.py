@@ -29,7 +29,12 @@ from sklearn.naive_bayes import MultinomialNB
 
 from skll.data import FeatureSet, NDJReader, NDJWriter, Reader
 from skll.experiments import run_configuration
-from skll.experiments.output import _compute_ylimits_for_featureset
+from skll.experiments.output import (
+    _compute_ylimits_for_featureset,
+    _write_learning_curve_file,
+    _write_summary_file,
+    generate_learning_curve_plots,
+)
 from skll.learner import Learner
 from skll.utils.constants import VALID_TASKS
 from skll.utils.logging import close_and_remove_logger_handlers, get_skll_logger
@@ -732,6 +737,94 @@ class TestOutput(unittest.TestCase):
             self.assertTrue(path_score.exists())
             self.assertTrue(path_time.exists())
 
+    # Write out a learning curve results file with a missing standard deviation
+    def make_learning_curve_results_with_nan(self):
+        result_dict = {
+            "experiment_name": "test_learning_curve_nan",
+            "featureset_name": "test_learning_curve_nan_fs",
+            "learner_name": "LogisticRegression",
+            "grid_objective": "accuracy",
+            "train_set_name": "train",
+            "computed_curve_train_sizes": [10, 20],
+            "learning_curve_train_scores_means": [0.9, 0.95],
+            "learning_curve_test_scores_means": [0.7, 0.8],
+            "learning_curve_fit_times_means": [0.01, 0.02],
+            "learning_curve_train_scores_stds": [0.01, 0.02],
+            "learning_curve_test_scores_stds": [float("nan"), 0.05],
+            "learning_curve_fit_times_stds": [0.001, 0.002],
+            "scikit_learn_version": "1.0",
+            "version": "4.0",
+        }
+
+        # the standard `json` module writes out NaN values as `NaN` literals
+        results_path = output_dir / "test_learning_curve_nan.results.json"
+        with open(results_path, "w") as results_file:
+            json.dump([result_dict], results_file)
+        return results_path
+
+    def test_learning_curve_file_with_nan(self):
+        """Test that missing values in the learning curve file are written as "nan"."""
+        results_path = self.make_learning_curve_results_with_nan()
+        output_tsv_path = output_dir / "test_learning_curve_nan_summary.tsv"
+        with open(output_tsv_path, "w", newline="") as output_file:
+            _write_learning_curve_file([str(results_path)], output_file)
+
+        with open(output_tsv_path) as tsvf:
+            rows = list(csv.DictReader(tsvf, dialect=csv.excel_tab))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]["test_score_std"], "nan")
+        self.assertEqual(rows[1]["test_score_std"], "0.05")
+
+    def check_summary_file_with_nan_results(self, ablation):
+        # write out the results files for an ablation experiment; note that
+        # the standard `json` module writes out NaN values as `NaN` literals
+        # which are not valid JSON but are present in SKLL results files
+        results_paths = []
+        for featureset_name, featureset in [
+            ("f0+f1_all", ["f0", "f1"]),
+            ("f0+f1_minus_f0", ["f1"]),
+            ("f0+f1_minus_f1", ["f0"]),
+        ]:
+            result_dict = {
+                "experiment_name": "test_summary_nan",
+                "featureset_name": featureset_name,
+                "featureset": json.dumps(featureset),
+                "learner_name": "LinearRegression",
+                "fold": "",
+                "score": float("nan"),
+                "additional_scores": {"pearson": float("nan")},
+            }
+            results_path = output_dir / f"test_summary_nan_{featureset_name}.results.json"
+            with open(results_path, "w") as results_file:
+                json.dump([result_dict], results_file)
+            with open(results_path) as results_file:
+                self.assertIn("NaN", results_file.read())
+            results_paths.append(str(results_path))
+
+        # the summary file should contain one row for each results file
+        summary_tsv_path = output_dir / "test_summary_nan_summary.tsv"
+        with open(summary_tsv_path, "w", newline="") as output_file:
+            _write_summary_file(results_paths, output_file, ablation=ablation)
+        with open(summary_tsv_path) as tsvf:
+            rows = list(csv.DictReader(tsvf, dialect=csv.excel_tab))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual([row["score"] for row in rows], ["nan", "nan", "nan"])
+
+        # for ablation experiments, the ablated features should be computed
+        # from the parsed featuresets in the results files
+        if ablation:
+            self.assertEqual([row["ablated_features"] for row in rows], ["", '["f0"]', '["f1"]'])
+        else:
+            self.assertNotIn("ablated_features", rows[0])
+
+    def test_summary_file_with_nan_results(self):
+        """Test that results files containing NaN values can be summarized."""
+        self.check_summary_file_with_nan_results(ablation=0)
+
+    def test_summary_file_with_nan_results_ablation(self):
+        """Test that ablation results files containing NaN values can be summarized."""
+        self.check_summary_file_with_nan_results(ablation=1)
+
     def test_learning_curve_output_with_objectives(self):
         """Test learning curve output for experiment with objectives option."""
         # Test to validate learning curve output
@@ -802,6 +895,44 @@ class TestOutput(unittest.TestCase):
             self.assertTrue(path_score.exists())
             self.assertTrue(path_time.exists())
 
+    def test_learning_curve_plots_without_fit_times(self):
+        """Test learning curve plots for a summary file without any fit times."""
+        summary_file_path = other_dir / "sample_learning_curve_summary.tsv"
+        outprefix = "test_learning_curve_without_fit_times"
+
+        # generate the plots directly from the summary file
+        generate_learning_curve_plots(outprefix, output_dir, summary_file_path)
+
+        # make sure that only the score plot is created
+        path_score = output_dir / f"{outprefix}_example_california.png"
+        path_time = output_dir / f"{outprefix}_example_california_times.png"
+        self.assertTrue(path_score.exists())
+        self.assertFalse(path_time.exists())
+
+    def test_learning_curve_plots_with_missing_learner(self):
+        """Test learning curve plots when a featureset is missing a learner."""
+        # create a summary file with two featuresets from the sample summary
+        # file where the second featureset does not have any SVR results
+        df_summary = pd.read_csv(other_dir / "sample_learning_curve_summary.tsv", sep="\t")
+        df_summary["fit_time_mean"] = df_summary["training_set_size"] / 1000
+        df_summary["fit_time_std"] = 0.001
+        df_summary2 = df_summary[df_summary["learner_name"] != "SVR"].assign(
+            featureset_name="example_california2"
+        )
+        summary_file_path = output_dir / "test_learning_curve_missing_learner_summary.tsv"
+        pd.concat([df_summary, df_summary2]).to_csv(summary_file_path, sep="\t", index=False)
+        outprefix = "test_learning_curve_missing_learner"
+
+        # generate the plots directly from the summary file
+        generate_learning_curve_plots(outprefix, output_dir, summary_file_path)
+
+        # make sure that both plots are created for both featuresets
+        for featureset_name in ["example_california", "example_california2"]:
+            path_score = output_dir / f"{outprefix}_{featureset_name}.png"
+            path_time = output_dir / f"{outprefix}_{featureset_name}_times.png"
+            self.assertTrue(path_score.exists())
+            self.assertTrue(path_time.exists())
+
     def test_learning_curve_ylimits(self):
         """Test that the ylimits for learning curves are generated as expected."""
         # create a test data frame